@@ -1,44 +1,145 @@
 # BOARD.py
 import pygame
+import queue
+import threading
 import time
+from array import array
+from solver_core import BOX_OF, solve_core, warm_up
 pygame.font.init()
 
+CELL_FONT = pygame.font.SysFont("comicsans", 40)
+HUD_FONT = pygame.font.SysFont("comicsans", 20)
+
+# Pre-rendered glyphs for digits 1-9, indexed by digit - 1
+DIGIT_BLACK = [CELL_FONT.render(str(d), 1, (0, 0, 0)) for d in range(1, 10)]
+DIGIT_GRAY = [CELL_FONT.render(str(d), 1, (128, 128, 128)) for d in range(1, 10)]
+
+# Area below the grid holding the timer and strikes
+HUD_RECT = pygame.Rect(0, 545, 540, 55)
+
+# Maximum number of solver steps replayed on the board per frame
+ANIM_STEPS = 50
+
+# Starting puzzle, one byte per cell indexed as row * 9 + col (0 for empty)
+INITIAL = bytes([
+    7, 8, 0, 4, 0, 0, 1, 2, 0,
+    6, 0, 0, 0, 7, 5, 0, 0, 9,
+    0, 0, 0, 6, 0, 1, 0, 7, 8,
+    0, 0, 7, 0, 4, 0, 2, 6, 0,
+    0, 0, 1, 0, 5, 0, 9, 3, 0,
+    9, 0, 4, 0, 6, 0, 0, 0, 5,
+    0, 7, 0, 3, 0, 0, 0, 1, 2,
+    1, 2, 0, 0, 0, 7, 4, 0, 0,
+    0, 4, 9, 2, 0, 6, 0, 0, 7,
+])
+
+# Number row and keypad keys mapped to the digit they enter
+KEY_TO_DIGIT = dict(zip(
+    [pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_4, pygame.K_5,
+     pygame.K_6, pygame.K_7, pygame.K_8, pygame.K_9,
+     pygame.K_KP1, pygame.K_KP2, pygame.K_KP3, pygame.K_KP4, pygame.K_KP5,
+     pygame.K_KP6, pygame.K_KP7, pygame.K_KP8, pygame.K_KP9],
+    list(range(1, 10)) * 2
+))
+
 
 class Grid:
     """
     Represents the Sudoku board and game logic
     """
-    board = [
-        [7, 8, 0, 4, 0, 0, 1, 2, 0],
-        [6, 0, 0, 0, 7, 5, 0, 0, 9],
-        [0, 0, 0, 6, 0, 1, 0, 7, 8],
-        [0, 0, 7, 0, 4, 0, 2, 6, 0],
-        [0, 0, 1, 0, 5, 0, 9, 3, 0],
-        [9, 0, 4, 0, 6, 0, 0, 0, 5],
-        [0, 7, 0, 3, 0, 0, 0, 1, 2],
-        [1, 2, 0, 0, 0, 7, 4, 0, 0],
-        [0, 4, 9, 2, 0, 6, 0, 0, 7]
-    ]
-
     def __init__(self, rows, cols, width, height, win):
         """
         Initializes the Sodoku grid
         """
         self.rows = rows
         self.cols = cols
-        self.cubes = [[Cube(self.board[i][j], i, j, width, height) for j in range(cols)] for i in range(rows)]
+        self.model = array('b', INITIAL)
+        self.temps = array('b', [0] * 81)
         self.width = width
         self.height = height
-        self.model = None
+        self.gap = width / 9
+        self.cell_x = [(idx % 9) * self.gap for idx in range(81)]
+        self.cell_y = [(idx // 9) * self.gap for idx in range(81)]
+        self.line_positions = [i * self.gap for i in range(rows + 1)]
+        self.thicknesses = [4 if i and i % 3 == 0 else 1 for i in range(rows + 1)]
+        self.row_mask = None
+        self.col_mask = None
+        self.box_mask = None
+        self.empty = None
         self.update_model()
-        self.selected = None
+        self.selected_idx = -1
         self.win = win
+        self.dirty = []
+        self.step_q = queue.Queue()
+        self._worker = None
+        self._solved_cells = set()
+        warm_up()
 
     def update_model(self):
         """
-        Updates the internal model with cube values.
+        Rebuilds the constraint masks and empty set from the model.
+
+        The model is a flat array of 81 digits indexed as row * 9 + col, with
+        the sketched values kept alongside in temps. Bit k of row_mask[r], col_mask[c] and box_mask[b] is set
+        when digit k + 1 is used in that row, column or box. The indices of the
+        empty cells are kept in the empty set.
+        """
+        self.empty = {idx for idx, val in enumerate(self.model) if val == 0}
+        self.row_mask = [0] * 9
+        self.col_mask = [0] * 9
+        self.box_mask = [0] * 9
+        for idx, val in enumerate(self.model):
+            if val:
+                self.toggle(idx // 9, idx % 9, val)
+
+    def toggle(self, row, col, val):
+        """
+        Flips the bit for a digit in the row, column and box masks of a cell.
+
+        Args:
+            row (int): Row index of the cell.
+            col (int): Column index of the cell.
+            val (int): The digit being placed or removed.
+        """
+        bit = 1 << (val - 1)
+        self.row_mask[row] ^= bit
+        self.col_mask[col] ^= bit
+        self.box_mask[BOX_OF[row * 9 + col]] ^= bit
+
+    def assign(self, row, col, val):
         """
-        self.model = [[self.cubes[i][j].value for j in range(self.cols)] for i in range(self.rows)]
+        Sets a digit in the model and keeps the constraint masks in sync.
+
+        Args:
+            row (int): Row index of the cell.
+            col (int): Column index of the cell.
+            val (int): The digit to be set, or 0 to empty the cell.
+        """
+        idx = row * 9 + col
+        old = self.model[idx]
+        if old:
+            self.toggle(row, col, old)
+        if val:
+            self.toggle(row, col, val)
+            self.empty.discard(idx)
+        else:
+            self.empty.add(idx)
+        self.model[idx] = val
+
+    def valid(self, num, pos):
+        """
+        Checks if a digit can be placed in a cell without conflicts.
+
+        Args:
+            num (int): The digit to be checked.
+            pos (tuple): The (row, col) position to be checked.
+
+        Returns:
+            bool: True if the digit is not used in the cell's row, column or box.
+        """
+        row, col = pos
+        used = self.row_mask[row] | self.col_mask[col] | self.box_mask[BOX_OF[row * 9 + col]]
+        return not (used >> (num - 1)) & 1
 
     def place(self, val):
         """
@@ -50,18 +151,20 @@ class Grid:
         Returns:
             bool: True if the move is valid, False otherwise.
         """
-        row, col = self.selected
-        if self.cubes[row][col].value == 0:
-            self.cubes[row][col].set(val)
-            self.update_model()
+        idx = self.selected_idx
+        row, col = divmod(idx, 9)
+        if self.model[idx] == 0:
+            if self.valid(val, (row, col)):
+                self.assign(row, col, val)
+
+                if self.solve():
+                    self.dirty.append(idx)
+                    return True
 
-            if valid(self.model, val, (row,col)) and self.solve():
-                return True
-            else:
-                self.cubes[row][col].set(0)
-                self.cubes[row][col].set_temp(0)
-                self.update_model()
-                return False
+            self.assign(row, col, 0)
+            self.temps[idx] = 0
+            self.dirty.append(idx)
+            return False
 
     def sketch(self, val):
         """
@@ -70,27 +173,112 @@ class Grid:
         Args:
             val (int): The temporary value to be set.
         """
-        row, col = self.selected
-        self.cubes[row][col].set_temp(val)
+        idx = self.selected_idx
+        if self.temps[idx] != val:
+            self.temps[idx] = val
+            self.dirty.append(idx)
+
+    def cell_rect(self, idx):
+        """
+        Returns the screen rectangle covered by a cube.
+
+        Args:
+            idx (int): Flat index of the cube, row * 9 + col.
+
+        Returns:
+            pygame.Rect: The cube's area in pixels.
+        """
+        return pygame.Rect(self.cell_x[idx], self.cell_y[idx], self.gap, self.gap)
+
+    def _draw_cell(self, idx, win):
+        """
+        Draws a cube's value, sketch and selection border.
+
+        Args:
+            idx (int): Flat index of the cube, row * 9 + col.
+            win: The Pygame window on which to draw the cube.
+        """
+        gap = self.gap
+        x = self.cell_x[idx]
+        y = self.cell_y[idx]
+        value = self.model[idx]
+
+        if self.temps[idx] != 0 and value == 0:
+            text = DIGIT_GRAY[self.temps[idx] - 1]
+            win.blit(text, (x + 5, y +5 ))
+        elif not(value == 0):
+            text = DIGIT_BLACK[value - 1]
+            win.blit(text, (x + (gap / 2 - text.get_width() / 2), y + (gap / 2 - text.get_height() / 2)))
+
+        if idx == self.selected_idx:
+            pygame.draw.rect(win, (255, 0, 0), (x, y, gap, gap), 3)
+
+    def _draw_change(self, idx, win, g=True):
+        """
+        Draws a changed cube state on the given window.
+
+        Args:
+            idx (int): Flat index of the cube, row * 9 + col.
+            win: The Pygame window on which to draw the cube.
+            g (bool): If True, the cube is drawn with a green border; otherwise, with a red border.
+        """
+        gap = self.gap
+        x = self.cell_x[idx]
+        y = self.cell_y[idx]
+        value = self.model[idx]
+
+        pygame.draw.rect(win, (255, 255, 255), (x, y, gap, gap), 0)
+
+        if value != 0:
+            text = DIGIT_BLACK[value - 1]
+            win.blit(text, (x + (gap / 2 - text.get_width() / 2), y + (gap / 2 - text.get_height() / 2)))
+        if g:
+            pygame.draw.rect(win, (0, 255, 0), (x, y, gap, gap), 3)
+        else:
+            pygame.draw.rect(win, (255, 0, 0), (x, y, gap, gap), 3)
 
     def draw(self):
         """
         Draws the Sudoku grid, including grid lines and cube values.
         """
-        # Draw Grid Lines
-        gap = self.width / 9
-        for i in range(self.rows+1):
-            if i % 3 == 0 and i != 0:
-                thick = 4
-            else:
-                thick = 1
-            pygame.draw.line(self.win, (0, 0, 0), (0, i * gap), (self.width, i * gap), thick)
-            pygame.draw.line(self.win, (0, 0, 0), (i * gap, 0), (i * gap, self.height), thick)
+        self.draw_lines()
 
         # Draw Cubes
-        for i in range(self.rows):
-            for j in range(self.cols):
-                self.cubes[i][j].draw(self.win)
+        for idx in range(81):
+            self._draw_cell(idx, self.win)
+        self.dirty = []
+
+    def draw_dirty(self):
+        """
+        Redraws only the cubes that changed since the last draw.
+
+        Returns:
+            list: The screen rectangles that were redrawn.
+        """
+        cells = set(self.dirty)
+        self.dirty = []
+        if not cells:
+            return []
+
+        rects = []
+        for idx in cells:
+            rect = self.cell_rect(idx)
+            pygame.draw.rect(self.win, (255, 255, 255), rect, 0)
+            rects.append(rect)
+
+        # Repaint the grid lines the cleared cubes overlapped
+        self.draw_lines()
+        for idx in cells:
+            self._draw_cell(idx, self.win)
+        return rects
+
+    def draw_lines(self):
+        """
+        Draws the grid lines.
+        """
+        for p, thick in zip(self.line_positions, self.thicknesses):
+            pygame.draw.line(self.win, (0, 0, 0), (0, p), (self.width, p), thick)
+            pygame.draw.line(self.win, (0, 0, 0), (p, 0), (p, self.height), thick)
 
     def select(self, row, col):
         """
@@ -100,21 +288,21 @@ class Grid:
             row (int): Row index of the cube.
             col (int): Column index of the cube.
         """
-        # Reset all other
-        for i in range(self.rows):
-            for j in range(self.cols):
-                self.cubes[i][j].selected = False
+        # Repaint the previous selection without its border
+        if self.selected_idx >= 0:
+            self.dirty.append(self.selected_idx)
 
-        self.cubes[row][col].selected = True
-        self.selected = (row, col)
+        self.selected_idx = row * 9 + col
+        self.dirty.append(self.selected_idx)
 
     def clear(self):
         """
         Clears the temporary value of the selected cube.
         """
-        row, col = self.selected
-        if self.cubes[row][col].value == 0:
-            self.cubes[row][col].set_temp(0)
+        idx = self.selected_idx
+        if self.model[idx] == 0:
+            self.temps[idx] = 0
+            self.dirty.append(idx)
 
     def click(self, pos):
         """
@@ -127,9 +315,8 @@ class Grid:
             tuple: Row and column indices corresponding to the position, or None if outside the grid.
         """
         if pos[0] < self.width and pos[1] < self.height:
-            gap = self.width / 9
-            x = pos[0] // gap
-            y = pos[1] // gap
+            x = pos[0] // self.gap
+            y = pos[1] // self.gap
             return (int(y), int(x))
         else:
             return None
@@ -141,217 +328,184 @@ class Grid:
         Returns:
             bool: True if the grid is fully filled, False otherwise.
         """
-        for i in range(self.rows):
-            for j in range(self.cols):
-                if self.cubes[i][j].value == 0:
-                    return False
-        return True
+        return not self.empty
 
     def solve(self):
         """
-        Solves the Sudoku grid using a backtracking algorithm.
+        Checks that the grid can be solved from its current state.
+
+        The search runs in the compiled solver core on copies of the model and
+        masks, so the grid itself is left unchanged.
 
         Returns:
             bool: True if a solution is found, False otherwise.
         """
-        find = find_empty(self.model)
-        if not find:
-            return True
-        else:
-            row, col = find
+        return solve_core(array('H', self.row_mask), array('H', self.col_mask),
+                          array('H', self.box_mask), array('b', self.model))
 
-        for i in range(1, 10):
-            if valid(self.model, i, (row, col)):
-                self.model[row][col] = i
-
-                if self.solve():
-                    return True
-
-                self.model[row][col] = 0
-
-        return False
-
-    def solve_board(self):
+    @property
+    def solving(self):
         """
-        Solves the Sudoku game by updating the display step by step.
-
-        Returns:
-            bool: True if the game is solved, False otherwise.
+        True while the solver worker is running or its steps are still queued.
         """
-        self.update_model()
-        find = find_empty(self.model)
-        if not find:
-            return True
-        else:
-            row, col = find
-
-        for i in range(1, 10):
-            if valid(self.model, i, (row, col)):
-                self.model[row][col] = i
-                self.cubes[row][col].set(i)
-                self.cubes[row][col].draw_change(self.win, True)
-                self.update_model()
-                pygame.display.update()
-                pygame.time.delay(100)
-
-                if self.solve_board():
-                    return True
-
-                self.model[row][col] = 0
-                self.cubes[row][col].set(0)
-                self.update_model()
-                self.cubes[row][col].draw_change(self.win, False)
-                pygame.display.update()
-                pygame.time.delay(100)
+        return self._worker is not None and (self._worker.is_alive() or not self.step_q.empty())
 
-        return False
-
-
-class Cube:
-    
-    """
-    A single cube in a Sudoku puzzle.
-    """
-    
-    rows = 9
-    cols = 9
-
-    def __init__(self, value, row, col, width, height):
+    def start_solve(self):
         """
-        Initializes a Cube instance.
+        Starts solving the board on a worker thread.
 
-        :param value: The value of the cube (0 for empty).
-        :param row: The row index of the cube in the puzzle grid.
-        :param col: The column index of the cube in the puzzle grid.
-        :param width: The width of the cube.
-        :param height: The height of the cube.
+        The worker searches on copies of the masks and queues every placement
+        and backtrack as (idx, val, is_set) on step_q, which apply_steps replays
+        from the main loop.
         """
-        self.value = value
-        self.temp = 0
-        self.row = row
-        self.col = col
-        self.width = width
-        self.height = height
-        self.selected = False
-
-    def draw(self, win):
+        if self.solving:
+            return
+
+        self.step_q = queue.Queue()
+        self._worker = threading.Thread(
+            target=self._solver_worker,
+            args=(set(self.empty), list(self.row_mask), list(self.col_mask), list(self.box_mask)),
+            daemon=True,
+        )
+        self._worker.start()
+
+    def _solver_worker(self, empty, row_mask, col_mask, box_mask):
         """
-        Draws the cube on the given window.
-
-        :param win: The Pygame window on which to draw the cube.
+        Runs the search on the worker thread and marks the end of the steps with None.
         """
-        fnt = pygame.font.SysFont("comicsans", 40)
-
-        gap = self.width / 9
-        x = self.col * gap
-        y = self.row * gap
-
-        if self.temp != 0 and self.value == 0:
-            text = fnt.render(str(self.temp), 1, (128, 128, 128))
-            win.blit(text, (x + 5, y +5 ))
-        elif not(self.value == 0):
-            text = fnt.render(str(self.value), 1, (0, 0, 0))
-            win.blit(text, (x + (gap / 2 - text.get_width() / 2), y + (gap / 2 - text.get_height() / 2)))
-
-        if self.selected:
-            pygame.draw.rect(win, (255, 0, 0), (x, y, gap, gap), 3)
+        solve_steps(empty, row_mask, col_mask, box_mask, self.step_q)
+        self.step_q.put(None)
 
-    def draw_change(self, win, g=True):
+    def apply_steps(self):
         """
-        Draws a changed cube state on the given window.
+        Replays up to ANIM_STEPS queued solver steps on the board.
 
-        :param win: The Pygame window on which to draw the cube.
-        :param g: If True, the cube is drawn with a green border; otherwise, with a red border.
+        Returns:
+            list: The screen rectangles that were redrawn.
         """
-        fnt = pygame.font.SysFont("comicsans", 40)
-
-        gap = self.width / 9
-        x = self.col * gap
-        y = self.row * gap
-
-        pygame.draw.rect(win, (255, 255, 255), (x, y, gap, gap), 0)
+        rects = []
+        for _ in range(ANIM_STEPS):
+            try:
+                step = self.step_q.get_nowait()
+            except queue.Empty:
+                break
+
+            if step is None:
+                # Solver finished, repaint the highlighted cubes normally
+                self.dirty.extend(self._solved_cells)
+                self._solved_cells = set()
+                break
+
+            idx, val, is_set = step
+            row, col = divmod(idx, 9)
+            self.assign(row, col, val)
+            self._draw_change(idx, self.win, is_set)
+            self._solved_cells.add(idx)
+            rects.append(self.cell_rect(idx))
+        return rects
+
+
+def solve_steps(empty, row_mask, col_mask, box_mask, steps):
+    """
+    Solves the puzzle in place using MRV backtracking, reporting every move.
+
+    :param empty: The set of flat indices of the empty cubes.
+    :param row_mask: Used-digit bitmasks for each row.
+    :param col_mask: Used-digit bitmasks for each column.
+    :param box_mask: Used-digit bitmasks for each box.
+    :param steps: Queue receiving (idx, val, is_set) for each placement and backtrack.
+    :return: True if a solution is found, False otherwise.
+    """
+    find = find_mrv(empty, row_mask, col_mask, box_mask)
+    if not find:
+        return True
 
-        text = fnt.render(str(self.value), 1, (0, 0, 0))
-        win.blit(text, (x + (gap / 2 - text.get_width() / 2), y + (gap / 2 - text.get_height() / 2)))
-        if g:
-            pygame.draw.rect(win, (0, 255, 0), (x, y, gap, gap), 3)
-        else:
-            pygame.draw.rect(win, (255, 0, 0), (x, y, gap, gap), 3)
+    row, col, cand = find
+    idx = row * 9 + col
+    box = BOX_OF[idx]
+    empty.discard(idx)
+    while cand:
+        bit = cand & -cand
+        cand ^= bit
+        row_mask[row] ^= bit
+        col_mask[col] ^= bit
+        box_mask[box] ^= bit
+        steps.put((idx, bit.bit_length(), True))
+
+        if solve_steps(empty, row_mask, col_mask, box_mask, steps):
+            return True
 
-    def set(self, val):
-        self.value = val
+        row_mask[row] ^= bit
+        col_mask[col] ^= bit
+        box_mask[box] ^= bit
+        steps.put((idx, 0, False))
 
-    def set_temp(self, val):
-        self.temp = val
+    empty.add(idx)
+    return False
 
 
-def find_empty(bo):
+def find_mrv(empty, row_mask, col_mask, box_mask):
     """
-    Finds the coordinates of the first empty cube in the puzzle.
-
-    :param bo: The Sudoku puzzle grid.
-    :return: The row and column indices of the empty cube, or None if no empty cube is found.
+    Finds the empty cube with the fewest remaining candidates (MRV heuristic).
+
+    :param empty: The set of flat indices of the empty cubes.
+    :param row_mask: Used-digit bitmasks for each row.
+    :param col_mask: Used-digit bitmasks for each column.
+    :param box_mask: Used-digit bitmasks for each box.
+    :return: The row and column indices of the empty cube and its candidate bitmask,
+        or None if no empty cube is found.
     """
-    for i in range(len(bo)):
-        for j in range(len(bo[0])):
-            if bo[i][j] == 0:
-                return (i, j)  # row, col
+    best = None
+    best_count = 10
+    for idx in empty:
+        row, col = divmod(idx, 9)
+        cand = ~(row_mask[row] | col_mask[col] | box_mask[BOX_OF[idx]]) & 0x1FF
+        count = cand.bit_count()
+        if count < best_count:
+            best = (row, col, cand)
+            best_count = count
+            # A dead end or a forced move cannot be beaten
+            if count <= 1:
+                break
+
+    return best
 
-    return None
 
-
-def valid(bo, num, pos):
+def redraw_window(win, board, time, strikes):
     """
-    Checks if placing a number in a given position is valid.
+    Redraws the entire game window.
 
-    :param bo: The Sudoku puzzle grid.
-    :param num: The number to be checked for validity.
-    :param pos: The position (row, column) to be checked.
-    :return: True if the number can be placed in the given position, False otherwise.
+    :param win: The Pygame window.
+    :param board: The Sudoku board instance.
+    :param time: The elapsed time.
+    :param strikes: The number of strikes.
     """
-    # Check row
-    for i in range(len(bo[0])):
-        if bo[pos[0]][i] == num and pos[1] != i:
-            return False
-
-    # Check column
-    for i in range(len(bo)):
-        if bo[i][pos[1]] == num and pos[0] != i:
-            return False
-
-    # Check box
-    box_x = pos[1] // 3
-    box_y = pos[0] // 3
-
-    for i in range(box_y * 3, box_y * 3 + 3):
-        for j in range(box_x * 3, box_x * 3 + 3):
-            if bo[i][j] == num and (i, j) != pos:
-                return False
+    win.fill((255, 255, 255))
+    draw_hud(win, time, strikes)
 
-    return True
+    # Draw grid and board
+    board.draw()
 
 
-def redraw_window(win, board, time, strikes):
+def draw_hud(win, time, strikes):
     """
-    Redraws the entire game window.
+    Redraws the timer and strikes below the grid.
 
     :param win: The Pygame window.
-    :param board: The Sudoku board instance.
     :param time: The elapsed time.
     :param strikes: The number of strikes.
+    :return: The screen rectangle that was redrawn.
     """
-    win.fill((255, 255, 255))
+    pygame.draw.rect(win, (255, 255, 255), HUD_RECT, 0)
+
     # Draw time
-    fnt = pygame.font.SysFont("comicsans", 20)
-    text = fnt.render("Time: " + format_time(time), 1, (0, 0, 0))
+    text = HUD_FONT.render("Time: " + format_time(time), 1, (0, 0, 0))
     win.blit(text, (400, 560))
-    
+
     # Draw Strikes
-    text = fnt.render("X " * strikes, 1, (255, 0, 0))
+    text = HUD_FONT.render("X " * strikes, 1, (255, 0, 0))
     win.blit(text, (20, 560))
-    
-    # Draw grid and board
-    board.draw()
+    return HUD_RECT
 
 
 def format_time(secs):
@@ -380,6 +534,10 @@ def main():
     run = True
     start = time.time()
     strikes = 0
+    redraw_window(win, board, 0, strikes)
+    pygame.display.update()
+    hud = (0, strikes)
+    clock = pygame.time.Clock()
     while run:
 
         play_time = round(time.time() - start)
@@ -391,54 +549,19 @@ def main():
                 
             # Handle key presses
             if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_1:
-                    key = 1
-                if event.key == pygame.K_2:
-                    key = 2
-                if event.key == pygame.K_3:
-                    key = 3
-                if event.key == pygame.K_4:
-                    key = 4
-                if event.key == pygame.K_5:
-                    key = 5
-                if event.key == pygame.K_6:
-                    key = 6
-                if event.key == pygame.K_7:
-                    key = 7
-                if event.key == pygame.K_8:
-                    key = 8
-                if event.key == pygame.K_9:
-                    key = 9
-                if event.key == pygame.K_KP1:
-                    key = 1
-                if event.key == pygame.K_KP2:
-                    key = 2
-                if event.key == pygame.K_KP3:
-                    key = 3
-                if event.key == pygame.K_KP4:
-                    key = 4
-                if event.key == pygame.K_KP5:
-                    key = 5
-                if event.key == pygame.K_KP6:
-                    key = 6
-                if event.key == pygame.K_KP7:
-                    key = 7
-                if event.key == pygame.K_KP8:
-                    key = 8
-                if event.key == pygame.K_KP9:
-                    key = 9
-                    
+                key = KEY_TO_DIGIT.get(event.key, key)
+
                 if event.key == pygame.K_DELETE:
                     board.clear()
                     key = None
 
                 if event.key == pygame.K_SPACE:
-                    board.solve_board()
+                    board.start_solve()
 
-                if event.key == pygame.K_RETURN:
-                    i, j = board.selected
-                    if board.cubes[i][j].temp != 0:
-                        if board.place(board.cubes[i][j].temp):
+                if event.key == pygame.K_RETURN and not board.solving:
+                    idx = board.selected_idx
+                    if idx >= 0 and board.temps[idx] != 0:
+                        if board.place(board.temps[idx]):
                             print("Success")
                         else:
                             print("Wrong")
@@ -457,11 +580,20 @@ def main():
                     key = None
         
         # If a cube is selected and a key is pressed, sketch the value
-        if board.selected and key != None:
+        if board.selected_idx >= 0 and key != None:
             board.sketch(key)
 
-        redraw_window(win, board, play_time, strikes)
-        pygame.display.update()
+        # Only push the cubes and HUD that changed to the screen
+        rects = board.apply_steps()
+        rects += board.draw_dirty()
+        if (play_time, strikes) != hud:
+            hud = (play_time, strikes)
+            rects.append(draw_hud(win, play_time, strikes))
+        if rects:
+            pygame.display.update(rects)
+
+        # Cap the loop at 60 frames per second
+        clock.tick(60)
 
 
 main()
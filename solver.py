@@ -1,3 +1,6 @@
+from array import array
+
+
 def solve(bo):
     """
     Solves the sudoku using backtracking
@@ -5,64 +8,74 @@ def solve(bo):
     :return: solution
     """
     
-    find = find_empty(bo)
+    model = array('b', [bo[i][j] for i in range(9) for j in range(9)])
+    if not solve_model(model):
+        return False
+    
+    for i in range(9):
+        bo[i][:] = model[i * 9:i * 9 + 9]
+    return True
+
+def solve_model(model):
+    """
+    Solves a flat sudoku model in place using backtracking
+    :param model: array('b') of 81 ints indexed as row * 9 + col
+    :return: bool
+    """
+    
+    find = find_empty(model)
     if find:
         row, col = find
     else:
         return True
     
     for i in range(1, 10):
-        if valid(bo, (row, col), i):
-            bo[row][col] = i
+        if valid(model, (row, col), i):
+            model[row * 9 + col] = i
             
-            if solve(bo):
+            if solve_model(model):
                 return True
             
-            bo[row][col] = 0
+            model[row * 9 + col] = 0
             
     return False
 
-def valid(bo, pos, num):
+def valid(model, pos, num):
     """
     Returns if the attempted movement is valid
-    :param bo: 2d list of ints
+    :param model: array('b') of 81 ints indexed as row * 9 + col
     :param pos: (row, col)
     :param num: int
     :return: bool
     """
     
-    # Check row
-    for i in range(0, len(bo)):
-        if bo[pos[0][i]] == num and pos[1] != i:
+    row, col = pos
+    box_row = (row // 3) * 3
+    box_col = (col // 3) * 3
+    
+    # Check row, col and box in a single pass
+    for k in range(9):
+        if model[row * 9 + k] == num and col != k:
             return False
-        
-    # Check col
-    for i in range(0, len(bo[0])):
-        if bo[i][pos[1]] == num and pos[0]!= i:
+        if model[k * 9 + col] == num and row != k:
+            return False
+        i = box_row + k // 3
+        j = box_col + k % 3
+        if model[i * 9 + j] == num and (i, j)!= pos:
             return False
-        
-    # Check box
-    box_x = pos[1] // 3
-    box_y = pos[0] // 3
-    
-    for i in range(box_y * 3, box_y * 3 + 3):
-        for j in range(box_x * 3, box_x * 3 + 3):
-            if bo[i][j] == num and (i, j)!= pos:
-                return False
             
     return True
 
-def find_empty(bo):
+def find_empty(model):
     """
     Finds an empty block in the board
-    :param bo: 2d list of ints
+    :param model: array('b') of 81 ints indexed as row * 9 + col
     :return: (int, int) row col
     """
     
-    for i in range(len(bo)):
-        for j in range(len(bo[0])):
-            if bo[i][j] == 0:
-                return (i, j)
+    for idx in range(81):
+        if model[idx] == 0:
+            return divmod(idx, 9)
     
     return None
 
@@ -0,0 +1,124 @@
+from array import array
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """
+        Falls back to plain Python when Numba is not installed.
+        """
+        def decorate(fn):
+            return fn
+        return decorate
+
+
+# Box index of each cell, indexed as row * 9 + col
+BOX_OF = tuple((r // 3) * 3 + c // 3 for r in range(9) for c in range(9))
+
+
+@njit(cache=True)
+def popcount(x):
+    """
+    Counts the set bits of a candidate mask
+    :param x: int
+    :return: int
+    """
+    count = 0
+    while x:
+        x &= x - 1
+        count += 1
+    return count
+
+
+@njit(cache=True)
+def lowest_digit(bit):
+    """
+    Converts a single-bit mask into the digit it stands for
+    :param bit: int with exactly one bit set
+    :return: int in 1-9
+    """
+    digit = 1
+    while bit > 1:
+        bit >>= 1
+        digit += 1
+    return digit
+
+
+@njit(cache=True)
+def solve_core(rm, cm, bm, filled):
+    """
+    Solves the sudoku in place using MRV cell selection and bitmask candidates.
+    The search is iterative so that it compiles without recursion.
+    :param rm: uint16[9] used-digit bitmasks per row
+    :param cm: uint16[9] used-digit bitmasks per column
+    :param bm: uint16[9] used-digit bitmasks per box
+    :param filled: int8[81] digits indexed as row * 9 + col, 0 for empty
+    :return: bool
+    """
+    stack_idx = [0] * 81
+    stack_cand = [0] * 81
+    depth = 0
+
+    while True:
+        # Pick the empty cell with the fewest candidates
+        best = -1
+        best_count = 10
+        best_cand = 0
+        for idx in range(81):
+            if filled[idx] == 0:
+                r = idx // 9
+                c = idx % 9
+                used = int(rm[r]) | int(cm[c]) | int(bm[BOX_OF[idx]])
+                cand = ~used & 0x1FF
+                count = popcount(cand)
+                if count < best_count:
+                    best = idx
+                    best_count = count
+                    best_cand = cand
+                    if count <= 1:
+                        break
+
+        if best == -1:
+            return True
+
+        stack_idx[depth] = best
+        stack_cand[depth] = best_cand
+        depth += 1
+
+        # Try the next candidate of the deepest cell, backtracking when exhausted
+        while True:
+            if depth == 0:
+                return False
+
+            idx = stack_idx[depth - 1]
+            r = idx // 9
+            c = idx % 9
+            b = BOX_OF[idx]
+
+            val = filled[idx]
+            if val:
+                bit = 1 << (val - 1)
+                rm[r] ^= bit
+                cm[c] ^= bit
+                bm[b] ^= bit
+                filled[idx] = 0
+
+            cand = stack_cand[depth - 1]
+            if cand:
+                bit = cand & -cand
+                stack_cand[depth - 1] = cand ^ bit
+                rm[r] ^= bit
+                cm[c] ^= bit
+                bm[b] ^= bit
+                filled[idx] = lowest_digit(bit)
+                break
+
+            depth -= 1
+
+
+def warm_up():
+    """
+    Solves an empty board once so that compilation happens up front
+    :return: None
+    """
+    solve_core(array('H', [0] * 9), array('H', [0] * 9), array('H', [0] * 9), array('b', [0] * 81))